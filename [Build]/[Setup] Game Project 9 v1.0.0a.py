@@ -9,7 +9,7 @@ executables = [cx_Freeze.Executable("[Game Project 9] Explorers of Elrualia v1.0
 
 cx_Freeze.setup(
     name="Explorers of Elrualia",
-    options={"build_exe": {"packages": ["pygame"],
+    options={"build_exe": {"packages": ["pygame", "elrualia"],
                            "include_files": ["data"]}},
     executables=executables,
     version="1.0.0"
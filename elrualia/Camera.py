@@ -0,0 +1,87 @@
+import pygame
+
+class Camera:
+    def __init__(self, width, height, WIDTH, HEIGHT, scroll_time=0):
+        self.camera = pygame.Rect(0, 0, width, height)
+        self.width = width
+        self.height = height
+        self.WIDTH = WIDTH
+        self.HEIGHT = HEIGHT
+
+        # Offset, updated in place (self.camera.topleft mirrors it)
+        self.x = 0
+        self.y = 0
+        self.view_rect = pygame.Rect(0, 0, 0, 0)
+
+        # Smooth Scrolling
+        self.scroll_time = scroll_time
+        self.scroll_elapsed = 0
+        self.start_x = self.start_y = 0
+        self.goal_x = self.goal_y = None
+
+    def resize(self, width, height):
+        self.width = width
+        self.height = height
+        self.camera.size = (width, height)
+        self.goal_x = self.goal_y = None
+
+    def apply(self, entity):
+        return entity.rect.move(self.x, self.y)
+
+    def apply_rect(self, rect):
+        return rect.move(self.x, self.y)
+
+    def view(self, rect):
+        # Shared rect, only valid until the next call
+        self.view_rect.x = rect.x + self.x
+        self.view_rect.y = rect.y + self.y
+        self.view_rect.width = rect.width
+        self.view_rect.height = rect.height
+        return self.view_rect
+
+    def visible(self, rect):
+        return (rect.right + self.x > 0 and rect.x + self.x < self.WIDTH and
+                rect.bottom + self.y > 0 and rect.y + self.y < self.HEIGHT)
+
+    def visible_tile_range(self, tilesize):
+        col_start = max(0, -self.x // tilesize)
+        row_start = max(0, -self.y // tilesize)
+        col_end = min(self.width // tilesize, (-self.x + self.WIDTH + tilesize - 1) // tilesize)
+        row_end = min(self.height // tilesize, (-self.y + self.HEIGHT + tilesize - 1) // tilesize)
+        return col_start, col_end, row_start, row_end
+
+    def draw_sprites(self, surface, sprites):
+        for sprite in sprites:
+            if self.visible(sprite.rect):
+                surface.blit(sprite.image, self.view(sprite.rect))
+
+    def update(self, target, dt):
+        x = -target.rect.centerx + int(self.WIDTH / 2)
+        y = -target.rect.centery + int(self.HEIGHT / 2)
+
+        # Limit to map size
+        x = min(0, x)  # Left
+        x = max(-(self.width - self.WIDTH), x)  # Right
+        y = min(0, y)  # Top
+        y = max(-(self.height - self.HEIGHT), y)  # Bottom
+
+        # Snap on first update or after a resize
+        if self.goal_x is None:
+            self.start_x, self.start_y = x, y
+            self.scroll_elapsed = self.scroll_time
+        elif x != self.goal_x or y != self.goal_y:
+            self.start_x, self.start_y = self.x, self.y
+            self.scroll_elapsed = 0
+        self.goal_x, self.goal_y = x, y
+
+        # Ease-out cubic towards the goal
+        if self.scroll_elapsed < self.scroll_time:
+            self.scroll_elapsed = min(self.scroll_time, self.scroll_elapsed + dt)
+            t = 1 - (1 - self.scroll_elapsed / self.scroll_time) ** 3
+            x = round(self.start_x + (self.goal_x - self.start_x) * t)
+            y = round(self.start_y + (self.goal_y - self.start_y) * t)
+
+        self.x = x
+        self.y = y
+        self.camera.x = x
+        self.camera.y = y
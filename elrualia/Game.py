@@ -0,0 +1,244 @@
+import pygame
+import sys
+from os import path
+
+from .Settings import *
+from .Functions import *
+from .ScaledGame import *
+from .Camera import *
+from .Map import *
+from .Sprites import *
+from .Overlay import *
+from .Startup import *
+
+vec = pygame.math.Vector2
+
+
+class Game:
+    def __init__(self):
+        self.startup = StartupReport()
+        with self.startup.phase("display"):
+            pygame.display.init()
+            pygame.font.init()
+            pygame.key.set_repeat(300, 75)
+            self.gameDisplay = ScaledGame(project_title, screen_size, 60)
+            self.clock = pygame.time.Clock()
+            self.dt = self.clock.tick(FPS) / 1000
+        with self.startup.phase("assets"):
+            self.load_data()
+        with self.startup.phase("title"):
+            self.title_screen()
+        with self.startup.phase("map"):
+            self.set_map(START_MAP)
+
+    def draw_text(self, text, font_name, size, color, x, y, align="nw"):
+        font = pygame.font.Font(font_name, size)
+        text_surface = font.render(text, True, color)
+        text_rect = text_surface.get_rect()
+        if align == "nw":
+            text_rect.topleft = (x, y)
+        if align == "ne":
+            text_rect.topright = (x, y)
+        if align == "sw":
+            text_rect.bottomleft = (x, y)
+        if align == "se":
+            text_rect.bottomright = (x, y)
+        if align == "n":
+            text_rect.midtop = (x, y)
+        if align == "s":
+            text_rect.midbottom = (x, y)
+        if align == "e":
+            text_rect.midright = (x, y)
+        if align == "w":
+            text_rect.midleft = (x, y)
+        if align == "center":
+            text_rect.center = (x, y)
+        self.gameDisplay.blit(text_surface, text_rect)
+
+    def load_data(self):
+        if getattr(sys, "frozen", False):
+            game_folder = path.dirname(sys.executable)
+        else:
+            game_folder = path.dirname(path.dirname(path.abspath(__file__)))
+        data_folder = path.join(game_folder, "data")
+        graphics_folder = path.join(data_folder, "graphics")
+        sfx_folder = path.join(data_folder, "sfx")
+        voice_folder = path.join(data_folder, "voice")
+        self.music_folder = path.join(data_folder, "music")
+        map_folder = path.join(data_folder, "map")
+
+        # Font
+        self.font = None
+
+        # Pause Screen
+        self.dim_screen = pygame.Surface(self.gameDisplay.get_size()).convert_alpha()
+        self.dim_screen.fill((100, 100, 100, 120))
+
+        # Map
+        self.maps = MapManager(map_folder)
+        self.map = None
+
+        # Characters
+        self.player_img = load_tile_table(path.join(graphics_folder, PLAYER_IMG), 32, 32)
+        self.skeleton_img = load_tile_table(path.join(graphics_folder, SKELETON_IMG), 32, 32)
+
+        # Music
+        self.music = "music_aaron_krogh_310_world_map.mp3"
+
+        # Image Items
+        self.item_images = {}
+
+        # Image Effects
+        self.effect_images = {}
+
+        # Sound Effects
+        self.sounds_effects = {}
+
+        # Sound Voices
+        self.sounds_voice = {}
+
+    def title_screen(self):
+        self.gameDisplay.fill(BLACK)
+        self.draw_text(project_title, self.font, 80, WHITE, WIDTH / 2, HEIGHT / 2, align="center")
+        self.draw_text("Loading...", self.font, 30, LIGHTGREY, WIDTH / 2, HEIGHT * 3 / 4, align="center")
+        self.gameDisplay.update()
+
+    def play_music(self):
+        # Audio is initialized the first time music plays
+        if not pygame.mixer.get_init():
+            with self.startup.phase("audio"):
+                pygame.mixer.pre_init(44100, -16, 2, 2048)
+                pygame.mixer.init()
+                pygame.mixer.music.load(path.join(self.music_folder, self.music))
+        pygame.mixer.music.play(-1)
+
+    def new(self):
+        self.debug_obstacle = False
+        self.debug_atk = False
+
+        self.paused = False
+        self.camera = Camera(self.map.width, self.map.height, WIDTH, HEIGHT, CAMERA_SCROLL_TIME)
+        self.grid_rect = pygame.Rect(0, 0, TILESIZE, TILESIZE)
+        self.load_map()
+
+    def load_map(self):
+        self.all_sprites = pygame.sprite.LayeredUpdates()
+        self.characters = pygame.sprite.Group()
+        self.obstacle = pygame.sprite.Group()
+        self.selection_overlay = SelectionOverlay(TILESIZE, SELECTION_ALPHA, SELECTION_PULSE)
+
+        for tile_layer in self.map.tmxdata.layers:
+            if tile_layer.name == "collision":
+                for x, y, image in tile_layer.tiles():
+                    Obstacle(self, x, y, self.map.tmxdata.tilewidth, self.map.tmxdata.tileheight)
+
+        for tile_object in self.map.tmxdata.objects:
+            obj_center = vec(tile_object.x + tile_object.width / 2, tile_object.y + tile_object.height / 2)
+            if tile_object.name == "cursor":
+                self.cursor = Cursor(self, obj_center.x, obj_center.y)
+            if tile_object.name == "player":
+                self.player = Character(self, obj_center.x, obj_center.y, self.player_img, "Player", PLAYER_WEAPON, PLAYER_MOVEMENT)
+            if tile_object.name == "skeleton":
+                self.skeleton = Character(self, obj_center.x, obj_center.y, self.skeleton_img, "Skeleton", SKELETON_WEAPON, SKELETON_MOVEMENT)
+
+    def set_map(self, name):
+        self.map = self.maps.change(name)
+        self.map_img = self.map.image
+        self.map_rect = self.map.rect
+
+    def change_map(self, name):
+        self.set_map(name)
+        self.camera.resize(self.map.width, self.map.height)
+        self.load_map()
+
+    def run(self):
+        self.playing = True
+        self.play_music()
+        self.startup.report()
+        while self.playing:
+            self.dt = self.clock.tick(FPS) / 1000
+            self.events()
+            if not self.paused:
+                self.update()
+            self.draw()
+
+    def quit_game(self):
+        self.maps.close()
+        pygame.quit()
+        quit()
+
+    def events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.quit_game()
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.quit_game()
+                if event.key == pygame.K_p:
+                    self.paused = not self.paused
+
+                if event.key == pygame.K_LEFT or event.key == pygame.K_a:
+                    self.cursor.move(dx=-1)
+                if event.key == pygame.K_RIGHT or event.key == pygame.K_d:
+                    self.cursor.move(dx=+1)
+                if event.key == pygame.K_UP or event.key == pygame.K_w:
+                    self.cursor.move(dy=-1)
+                if event.key == pygame.K_DOWN or event.key == pygame.K_s:
+                    self.cursor.move(dy=+1)
+
+                if event.key == pygame.K_j:
+                    self.debug_obstacle = not self.debug_obstacle
+                if event.key == pygame.K_r:
+                    if not self.debug_atk:
+                        self.player.range = 2
+                    else:
+                        self.player.range = 1
+                    self.debug_atk = not self.debug_atk
+
+                if event.key == pygame.K_m:
+                    if self.map.connections:
+                        self.change_map(self.map.connections[0])
+
+                if event.key == pygame.K_h:
+                    self.cursor.action()
+
+    def update(self):
+        self.all_sprites.update()
+        self.camera.update(self.cursor, self.dt)
+
+    def draw(self):
+        # Map
+        self.gameDisplay.blit(self.map_img, self.camera.view(self.map_rect))
+
+        # Selection
+        # [0, 0, 1, 0, 0],
+        # [0, 1, 1, 1, 0],
+        # [1, 1, 1, 1, 1],
+        # [0, 1, 1, 1, 0],
+        # [0, 0, 1, 0, 0]]
+        if self.cursor.selection.alive():
+            self.selection_overlay.draw(self.gameDisplay, self.camera)
+
+        # Grid
+        col_start, col_end, row_start, row_end = self.camera.visible_tile_range(TILESIZE)
+        for col in range(col_start, col_end):
+            self.grid_rect.x = TILESIZE * col + self.camera.x
+            for row in range(row_start, row_end):
+                self.grid_rect.y = TILESIZE * row + self.camera.y
+                pygame.draw.rect(self.gameDisplay, LIGHTGREY, self.grid_rect, 1)
+
+        # Sprite
+        self.camera.draw_sprites(self.gameDisplay, self.all_sprites)
+
+        if self.debug_obstacle:
+            for obstacle in self.obstacle:
+                if self.camera.visible(obstacle.rect):
+                    pygame.draw.rect(self.gameDisplay, CYAN, self.camera.view(obstacle.rect), 1)
+
+        # Pause
+        if self.paused:
+            self.gameDisplay.blit(self.dim_screen, (0, 0))
+            self.draw_text("Paused", self.font, 105, RED, WIDTH / 2, HEIGHT / 2, align="center")
+
+        self.gameDisplay.update()
@@ -0,0 +1,151 @@
+import pygame
+import pytmx
+import queue
+import threading
+from collections import OrderedDict
+from os import path
+from pytmx.util_pygame import pygame_image_loader
+
+# Tilesets shared between maps, decoded once per (filename, colorkey, pixelalpha)
+tileset_cache = {}
+tileset_lock = threading.Lock()
+
+
+def cached_image_loader(filename, colorkey, **kwargs):
+    key = (filename, colorkey, kwargs.get("pixelalpha", True))
+    with tileset_lock:
+        if key not in tileset_cache:
+            tileset_cache[key] = tile_loader(pygame_image_loader(filename, colorkey, **kwargs))
+        return tileset_cache[key]
+
+
+def tile_loader(load_image):
+    tiles = {}
+    lock = threading.Lock()
+
+    def load_tile(rect=None, flags=None):
+        key = (tuple(rect) if rect else None, flags)
+        with lock:
+            if key not in tiles:
+                tiles[key] = load_image(rect, flags)
+            return tiles[key]
+    return load_tile
+
+
+class Map:
+    def __init__(self, filename):
+        self.filename = filename
+        self.tmxdata = pytmx.TiledMap(filename, image_loader=cached_image_loader, pixelalpha=True)
+        self.width = self.tmxdata.width * self.tmxdata.tilewidth
+        self.height = self.tmxdata.height * self.tmxdata.tileheight
+
+        # Connected maps (Map property "connections": "Map_2.tmx, Map_3.tmx")
+        connections = self.tmxdata.properties.get("connections") or ""
+        self.connections = [name.strip() for name in connections.split(",") if name.strip()]
+
+        # Surface
+        self.image = None
+        self.rect = None
+
+    def render(self, surface):
+        ti = self.tmxdata.get_tile_image_by_gid
+        for layer in self.tmxdata.visible_layers:
+            if isinstance(layer, pytmx.TiledTileLayer):
+                for x, y, gid in layer:
+                    tile = ti(gid)
+                    if tile:
+                        surface.blit(tile, (x * self.tmxdata.tilewidth, y * self.tmxdata.tileheight))
+
+    def make_map(self):
+        temp_surface = pygame.Surface((self.width, self.height))
+        self.render(temp_surface)
+        return temp_surface
+
+    def prepare(self):
+        self.image = self.make_map()
+        self.rect = self.image.get_rect()
+
+
+class MapManager:
+    def __init__(self, map_folder, cache_size=4):
+        self.map_folder = map_folder
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.pending = {}
+        self.current = None
+
+        # Prefetch
+        self.lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.closed = False
+        self.thread = threading.Thread(target=self.worker, daemon=True)
+        self.thread.start()
+
+    def get(self, name):
+        with self.lock:
+            if name in self.cache:
+                self.cache.move_to_end(name)
+                return self.cache[name]
+            loading = self.pending.get(name)
+
+        # Wait for the background load instead of parsing the map twice
+        if loading:
+            loading.wait()
+            with self.lock:
+                if name in self.cache:
+                    self.cache.move_to_end(name)
+                    return self.cache[name]
+        return self.load(name)
+
+    def load(self, name):
+        game_map = Map(path.join(self.map_folder, name))
+        game_map.prepare()
+        with self.lock:
+            self.cache[name] = game_map
+            self.cache.move_to_end(name)
+            self.evict()
+        return game_map
+
+    def evict(self):
+        for name in list(self.cache):
+            if len(self.cache) <= self.cache_size:
+                break
+            if self.cache[name] is not self.current:
+                del self.cache[name]
+
+    def change(self, name):
+        self.current = self.get(name)
+        self.prefetch(self.current.connections)
+        return self.current
+
+    def prefetch(self, names):
+        for name in names:
+            with self.lock:
+                if name in self.cache or name in self.pending:
+                    continue
+                self.pending[name] = threading.Event()
+            self.queue.put(name)
+
+    def close(self):
+        # Stop prefetching before pygame shuts down
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+
+    def worker(self):
+        while True:
+            name = self.queue.get()
+            if name is None:
+                self.queue.task_done()
+                break
+            try:
+                if not self.closed:
+                    self.load(name)
+            except Exception:
+                # get() loads the map again on the main thread and raises there
+                pass
+            finally:
+                with self.lock:
+                    loading = self.pending.pop(name)
+                loading.set()
+                self.queue.task_done()
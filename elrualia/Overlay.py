@@ -0,0 +1,46 @@
+import math
+import pygame
+
+
+class SelectionOverlay:
+    def __init__(self, tilesize, alpha=255, pulse=False, pulse_speed=2, pulse_alpha=100):
+        self.tilesize = tilesize
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+        # Tint
+        self.alpha = alpha
+        self.pulse = pulse
+        self.pulse_speed = pulse_speed
+        self.pulse_alpha = pulse_alpha
+
+    def build(self, pos, mov, atk, selection_mov, selection_atk, mov_color, atk_color):
+        size = (2 * (mov + atk) + 1) * self.tilesize
+        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        # Movement grid is centered inside the attack grid
+        cell = pygame.Rect(0, 0, self.tilesize, self.tilesize)
+        for grid, color, offset in ((selection_mov, mov_color, atk), (selection_atk, atk_color, 0)):
+            for i, row in enumerate(grid):
+                for j, selected in enumerate(row):
+                    if selected:
+                        cell.x = (j + offset) * self.tilesize
+                        cell.y = (i + offset) * self.tilesize
+                        self.image.fill(color, cell)
+
+        self.rect.size = (size, size)
+        self.rect.x = (pos[0] - mov - atk) * self.tilesize
+        self.rect.y = (pos[1] - mov - atk) * self.tilesize
+
+    def clear(self):
+        self.image = None
+
+    def draw(self, surface, camera):
+        if self.image is None:
+            return
+        alpha = self.alpha
+        if self.pulse:
+            wave = (math.sin(pygame.time.get_ticks() / 1000 * self.pulse_speed * 2 * math.pi) + 1) / 2
+            alpha -= int(self.pulse_alpha * wave)
+        self.image.set_alpha(alpha)
+        surface.blit(self.image, camera.view(self.rect))
@@ -0,0 +1,54 @@
+from .Weapon import *
+
+"""
+    Settings
+"""
+# Main Settings
+project_title = "Explorers of Elrualia"
+screen_size = WIDTH, HEIGHT = 800, 640
+FPS = 60
+START_MAP = "Map_1.tmx"
+
+# Secondary Settings
+TILESIZE = 32
+GRIDWIDTH = WIDTH / TILESIZE
+GRIDHEIGHT = HEIGHT / TILESIZE
+CAMERA_SCROLL_TIME = 0.15
+
+# Layer Settings
+LAYER_CURSOR = 3
+LAYER_PLAYER = 2
+LAYER_SELECTION = 1
+
+# Selection Settings
+SELECTION_ALPHA = 255
+SELECTION_PULSE = False
+
+"""
+    Colors
+"""
+RED = 255, 0, 0
+GREEN = 0, 255, 0
+BLUE = 0, 0, 255
+
+YELLOW = 255, 255, 0
+MAGENTA = 255, 0, 255
+CYAN = 0, 255, 255
+
+LIGHTGREY = 100, 100, 100
+
+BLACK = 0, 0, 0
+WHITE = 255, 255, 255
+
+
+"""
+    Characters
+"""
+# Characters Settings
+PLAYER_IMG = "character_pipoya_male_01_2.png"
+PLAYER_WEAPON = Iron_Sword()
+PLAYER_MOVEMENT = 3
+
+SKELETON_IMG = "character_pipoya_enemy_04_1.png"
+SKELETON_WEAPON = Iron_Sword()
+SKELETON_MOVEMENT = 2
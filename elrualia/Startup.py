@@ -0,0 +1,26 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupReport:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+        print("Startup:")
+        for name, duration in self.phases:
+            print("  %-10s %7.1f ms" % (name, duration * 1000))
+        print("  %-10s %7.1f ms" % ("total", (time.perf_counter() - self.start) * 1000))
@@ -0,0 +1,11 @@
+class Weapon:
+    def __init__(self, attack, hit, critical, range, weight):
+        self.attack = attack
+        self.hit = hit
+        self.critical = critical
+        self.range = range
+        self.weight = weight
+
+class Iron_Sword(Weapon):
+    def __init__(self):
+        Weapon.__init__(self, 5, 100, 0, 1, 2)
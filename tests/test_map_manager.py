@@ -0,0 +1,109 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from elrualia.Map import MapManager
+
+MAP_TMX = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.2" orientation="orthogonal" renderorder="left-up" width="2" height="2" tilewidth="32" tileheight="32" infinite="0" nextlayerid="2" nextobjectid="1">
+ <properties>
+  <property name="connections" value="%s"/>
+ </properties>
+ <layer id="1" name="ground" width="2" height="2">
+  <data encoding="csv">
+0,0,
+0,0
+</data>
+ </layer>
+</map>
+"""
+
+
+class MapManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((32, 32))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.map_folder = tempfile.mkdtemp()
+        self.write_map("Map_1.tmx", "Map_2.tmx, Map_3.tmx")
+        self.write_map("Map_2.tmx", "Map_1.tmx")
+        self.write_map("Map_3.tmx", "")
+
+    def tearDown(self):
+        shutil.rmtree(self.map_folder)
+
+    def write_map(self, name, connections):
+        with open(os.path.join(self.map_folder, name), "w") as file:
+            file.write(MAP_TMX % connections)
+
+    def manager(self, cache_size=4):
+        maps = MapManager(self.map_folder, cache_size)
+        self.addCleanup(maps.close)
+
+        # Count loads per map, slowed down so get() lands on a pending prefetch
+        self.loads = []
+        load = maps.load
+
+        def slow_load(name):
+            self.loads.append((name, threading.current_thread() is maps.thread))
+            time.sleep(0.05)
+            return load(name)
+        maps.load = slow_load
+        return maps
+
+    def test_prefetch_fills_cache(self):
+        maps = self.manager()
+        maps.change("Map_1.tmx")
+        maps.queue.join()
+        self.assertEqual(set(maps.cache), {"Map_1.tmx", "Map_2.tmx", "Map_3.tmx"})
+        self.assertIn(("Map_2.tmx", True), self.loads)
+        self.assertIn(("Map_3.tmx", True), self.loads)
+
+    def test_get_waits_on_pending_load(self):
+        maps = self.manager()
+        maps.prefetch(["Map_2.tmx"])
+        game_map = maps.get("Map_2.tmx")
+        self.assertIs(game_map, maps.cache["Map_2.tmx"])
+        self.assertEqual(self.loads, [("Map_2.tmx", True)])
+
+    def test_evict_keeps_current(self):
+        maps = self.manager(cache_size=1)
+        current = maps.change("Map_1.tmx")
+        maps.queue.join()
+        self.assertIs(maps.cache.get("Map_1.tmx"), current)
+        self.assertEqual(len(maps.cache), 1)
+
+    def test_failed_prefetch_loads_on_main_thread(self):
+        maps = self.manager()
+        maps.prefetch(["Map_4.tmx"])
+        maps.queue.join()
+        self.assertNotIn("Map_4.tmx", maps.cache)
+
+        self.write_map("Map_4.tmx", "")
+        game_map = maps.get("Map_4.tmx")
+        self.assertIs(game_map, maps.cache["Map_4.tmx"])
+        self.assertEqual(self.loads[-1], ("Map_4.tmx", False))
+
+    def test_close_stops_worker(self):
+        maps = self.manager()
+        maps.close()
+        self.assertFalse(maps.thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()